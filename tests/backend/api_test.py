@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections.abc import Generator
 from http import HTTPStatus
 from pathlib import Path
 
@@ -9,17 +8,6 @@ from werkzeug.test import Client, TestResponse as Response
 
 import tests.data
 import tests.utils
-from valens import app
-
-
-@pytest.fixture(name="client")
-def fixture_client(tmp_path: Path) -> Generator[Client, None, None]:
-    app.config["DATABASE"] = f"sqlite:///{tmp_path}/valens.db"
-    app.config["SECRET_KEY"] = b"TEST_KEY"
-    app.config["TESTING"] = True
-
-    with app.test_client() as client, app.app_context():
-        yield client
 
 
 def create_session(client: Client, user_id: int = 1) -> Response:
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+from collections.abc import Generator
+from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import _pytest
 import pytest
 import selenium
 import selenium.webdriver
+from werkzeug.test import Client
 
 from valens import app, database as db
 
 
+@pytest.fixture(name="client")
+def fixture_client(tmp_path: Path) -> Generator[Client, None, None]:
+    app.config["DATABASE"] = f"sqlite:///{tmp_path}/valens.db"
+    app.config["SECRET_KEY"] = b"TEST_KEY"
+    app.config["TESTING"] = True
+
+    with app.test_client() as client, app.app_context():
+        yield client
+
+
 @pytest.fixture
 def alembic_config() -> dict[str, str]:
     return {"script_location": "valens:migrations"}
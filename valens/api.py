@@ -33,6 +33,16 @@ from valens.models import (
 
 bp = Blueprint("api", __name__, url_prefix="/api")
 
+BODY_FAT_PARTS = (
+    "chest",
+    "abdominal",
+    "thigh",
+    "tricep",
+    "subscapular",
+    "suprailiac",
+    "midaxillary",
+)
+
 
 class DeserializationError(Exception):
     pass
@@ -441,15 +451,7 @@ def create_body_fat() -> ResponseReturnValue:
             date=date.fromisoformat(data["date"]),
             **{
                 part: int(data[part]) if data[part] is not None else None
-                for part in [
-                    "chest",
-                    "abdominal",
-                    "thigh",
-                    "tricep",
-                    "subscapular",
-                    "suprailiac",
-                    "midaxillary",
-                ]
+                for part in BODY_FAT_PARTS
             },
         )
     except (KeyError, ValueError) as e:
@@ -491,15 +493,7 @@ def replace_body_fat(date_: str) -> ResponseReturnValue:
     assert isinstance(data, dict)
 
     try:
-        for attr in [
-            "chest",
-            "abdominal",
-            "thigh",
-            "tricep",
-            "subscapular",
-            "suprailiac",
-            "midaxillary",
-        ]:
+        for attr in BODY_FAT_PARTS:
             setattr(body_fat, attr, int(data[attr]) if data[attr] is not None else None)
     except (KeyError, ValueError) as e:
         return jsonify({"details": str(e)}), HTTPStatus.BAD_REQUEST